@@ -1,118 +1,289 @@
 from flask import Flask, render_template, request, jsonify, flash, redirect, url_for, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 import os
 from werkzeug.utils import secure_filename
 from PIL import Image
 import numpy as np
+import cv2
 import io
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Fast JSON serialization for API responses when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# SIMD-accelerated base64 decoding when available; same API as the stdlib
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+# Optional decoders; the app falls back to whichever ones are installed
+try:
+    import zxingcpp
+    _HAS_ZXING = True
+except ImportError:
+    _HAS_ZXING = False
+
+try:
+    from pyzbar import pyzbar
+    _HAS_PYZBAR = True
+except (ImportError, OSError):
+    # A missing zbar shared library raises ImportError on Linux and
+    # OSError (e.g. FileNotFoundError for a dependent DLL) on Windows
+    _HAS_PYZBAR = False
+
+# Optional GPU detector (YOLOv8), opt-in with QRDET_ENABLED=1 on CUDA hosts
+_QRDET = None
+if os.environ.get('QRDET_ENABLED', '').lower() in ('1', 'true', 'yes'):
+    try:
+        import torch
+        from qrdet import QRDetector
+        if torch.cuda.is_available():
+            _QRDET = QRDetector(model_size='n')
+    except Exception as e:
+        # Missing packages, a failed weights download or a CUDA error all
+        # leave the app on the CPU decoders
+        print(f"qrdet disabled: {e}")
+        _QRDET = None
+
+# The YOLO predictor is not safe to share between threads; gthread workers
+# serve several requests at once, so detections take turns on the model
+_QRDET_LOCK = threading.Lock()
+
+# Shared by all requests so decodes don't pay for thread start-up each time
+_DECODE_POOL = ThreadPoolExecutor(thread_name_prefix='qr-decode')
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize JSON with orjson, which is much faster on the long base64 crops."""
+    
+    def _option(self):
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._option()).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._option()), mimetype=self.mimetype)
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff'}
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff'})
+# Leading bytes of the formats above: PNG, JPEG, GIF, BMP, TIFF (LE/BE)
+IMAGE_SIGNATURES = (b'\x89PNG', b'\xff\xd8\xff', b'GIF8', b'BM', b'II*\x00', b'MM\x00*')
 MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
+DECODE_TARGET_SIZE = 1600  # Longest side the decoders need to find a QR code
+ZXING_RESCAN_SCALE = 4  # Downscale factor of the copy rescanned for missed codes
+STATIC_MAX_AGE = 24 * 60 * 60  # Browser cache lifetime for robots/sitemap/favicon (1 day)
 
-# Create upload directory if it doesn't exist
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension."""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    dot = filename.rfind('.')
+    return dot != -1 and filename[dot + 1:].lower() in ALLOWED_EXTENSIONS
+
+def has_image_signature(stream):
+    """Peek at the first bytes of an upload and check for a known image format."""
+    header = stream.read(12)
+    stream.seek(0)
+    return header.startswith(IMAGE_SIGNATURES)
 
-def context_crop(image, box):
-    """Crop image with context and return as base64."""
+def context_crop(arr, box):
+    """Crop an image array with context and return it as a base64 PNG."""
     try:
-        # box is (left, top, right, bottom)
-        crop = image.crop(box)
+        # box is (left, top, right, bottom); slicing gives a view, not a copy
+        left, top, right, bottom = (max(int(v), 0) for v in box)
+        crop = arr[top:bottom, left:right]
         
         # Resize if too small to be visible
-        if crop.width < 100 or crop.height < 100:
-            scale = max(100/crop.width, 100/crop.height)
-            new_size = (int(crop.width * scale), int(crop.height * scale))
-            crop = crop.resize(new_size, Image.Resampling.LANCZOS)
-            
-        buffered = io.BytesIO()
-        crop.save(buffered, format="PNG")
-        return base64.b64encode(buffered.getvalue()).decode('utf-8')
+        height, width = crop.shape[:2]
+        if width < 100 or height < 100:
+            scale = max(100/width, 100/height)
+            new_size = (int(width * scale), int(height * scale))
+            crop = cv2.resize(crop, new_size, interpolation=cv2.INTER_LINEAR)
+        
+        # Minimal deflate effort is plenty for an inline thumbnail
+        ok, buf = cv2.imencode('.png', crop, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            return None
+        return base64.b64encode(buf).decode('ascii')
     except Exception as e:
         print(f"Error creating crop: {e}")
         return None
 
-def decode_with_zxing(image_path):
-    """Decode QR code using zxing-cpp library."""
-    try:
-        import zxingcpp
-        
-        # Read image
-        image = Image.open(image_path)
-        
-        # Convert to grayscale if needed
-        if image.mode != 'L':
-            gray_image = image.convert('L')
-        else:
-            gray_image = image
-        
-        # Convert PIL image to numpy array
-        img_array = np.array(gray_image)
-        
-        # Try to decode
-        results = zxingcpp.read_barcodes(img_array)
-        
-        if results:
-            decoded_items = []
-            for result in results:
-                if result.format == zxingcpp.BarcodeFormat.QRCode:
-                    # Calculate bounding box from position
-                    # result.position is usually an object with top_left, top_right, etc. or a simplified string
-                    # We'll try to get coordinates regardless of the specific zxing-cpp version structure
-                    try:
-                        pts = [(p.x, p.y) for p in [result.position.top_left, result.position.top_right, result.position.bottom_right, result.position.bottom_left]]
-                        min_x = min(p[0] for p in pts)
-                        max_x = max(p[0] for p in pts)
-                        min_y = min(p[1] for p in pts)
-                        max_y = max(p[1] for p in pts)
-                        box = (min_x, min_y, max_x, max_y)
-                        crop_b64 = context_crop(image, box)
-                    except:
-                        crop_b64 = None
-
-                    decoded_items.append({
-                        'text': result.text,
-                        'crop': crop_b64,
-                        'confidence': 'High (ZXing)'
-                    })
-            return decoded_items if decoded_items else None
-        
+def load_color(image_data):
+    """Decode encoded image bytes into a uint8 gray, BGR or BGRA array for crops."""
+    # IMREAD_UNCHANGED keeps any alpha channel and, like the grayscale
+    # decode, ignores EXIF orientation
+    arr = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_UNCHANGED)
+    if arr is not None and arr.dtype == np.uint8:
+        return arr
+    
+    # GIFs and 16-bit images go through PIL instead
+    image = Image.open(io.BytesIO(image_data))
+    if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info:
+        return cv2.cvtColor(np.asarray(image.convert('RGBA')), cv2.COLOR_RGBA2BGRA)
+    return cv2.cvtColor(np.asarray(image.convert('RGB')), cv2.COLOR_RGB2BGR)
+
+def load_grayscale(image_data):
+    """Decode encoded image bytes straight into a grayscale uint8 array."""
+    # OpenCV decodes directly to 8-bit gray; ignore EXIF orientation so
+    # coordinates line up with the PIL image used for crops
+    img_array = cv2.imdecode(np.frombuffer(image_data, np.uint8),
+                             cv2.IMREAD_GRAYSCALE | cv2.IMREAD_IGNORE_ORIENTATION)
+    if img_array is None:
+        # Formats OpenCV can't read (e.g. GIF) go through PIL instead
+        img_array = np.asarray(Image.open(io.BytesIO(image_data)).convert('L'))
+    return img_array
+
+# OpenCV read flags that shrink the image while decoding it (JPEG scales in the IDCT)
+_REDUCED_GRAYSCALE = {
+    2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
+def load_downscaled(image_data, target=DECODE_TARGET_SIZE):
+    """Load an image as grayscale, shrinking large photos at decode time.
+    
+    Returns the array and the shrink factor (1, 2, 4 or 8) that was applied.
+    """
+    # Image.open only parses the header, so this doesn't decode any pixels
+    with Image.open(io.BytesIO(image_data)) as image:
+        longest = max(image.size)
+    
+    shrink = 1
+    while shrink < 8 and longest // (shrink * 2) >= target:
+        shrink *= 2
+    
+    if shrink > 1:
+        img_array = cv2.imdecode(np.frombuffer(image_data, np.uint8),
+                                 _REDUCED_GRAYSCALE[shrink] | cv2.IMREAD_IGNORE_ORIENTATION)
+        if img_array is not None:
+            return img_array, shrink
+    
+    return load_grayscale(image_data), 1
+
+def _read_zxing(img_array, dx=0, dy=0):
+    """Return (text, box) for each QR code zxing-cpp finds, box shifted by (dx, dy)."""
+    hits = []
+    for result in zxingcpp.read_barcodes(img_array):
+        if result.format != zxingcpp.BarcodeFormat.QRCode:
+            continue
+        # Calculate bounding box from position
+        # result.position is usually an object with top_left, top_right, etc. or a simplified string
+        # We'll try to get coordinates regardless of the specific zxing-cpp version structure
+        try:
+            pts = [(p.x, p.y) for p in [result.position.top_left, result.position.top_right, result.position.bottom_right, result.position.bottom_left]]
+            arr = np.array(pts, dtype=np.int32)
+            (min_x, min_y), (max_x, max_y) = arr.min(axis=0), arr.max(axis=0)
+            box = (int(min_x) + dx, int(min_y) + dy, int(max_x) + dx, int(max_y) + dy)
+        except:
+            box = None
+        hits.append((result.text, box))
+    return hits
+
+def _is_duplicate(decoded_items, text, box):
+    """Check whether a hit repeats an earlier one, e.g. a partly erased code found again."""
+    for item in decoded_items:
+        if item['text'] != text:
+            continue
+        if box is None or item['box'] is None:
+            return True
+        # Same text with overlapping boxes is the same code
+        left, top, right, bottom = item['box']
+        if box[0] < right and left < box[2] and box[1] < bottom and top < box[3]:
+            return True
+    return False
+
+def decode_with_zxing(img_array, max_passes=4):
+    """Decode QR codes from a grayscale array using zxing-cpp.
+    
+    The full image is scanned once. Found codes are then erased from a
+    coarse copy, which is rescanned for codes missed next to larger or
+    overlapping neighbours; only the regions it flags are decoded again at
+    full resolution, so the extra passes stay cheap.
+    Returns a list of hits with their bounding box, or None.
+    """
+    if not _HAS_ZXING:
         return None
+    
+    try:
+        decoded_items = []
+        
+        def add_hits(hits, confidence='High (ZXing)'):
+            for text, box in hits:
+                if not _is_duplicate(decoded_items, text, box):
+                    decoded_items.append({'text': text, 'box': box, 'confidence': confidence})
+        
+        hits = _read_zxing(img_array)
+        add_hits(hits)
+        
+        height, width = img_array.shape[:2]
+        scale = ZXING_RESCAN_SCALE
+        # A code we couldn't erase would just be found again
+        if max_passes > 1 and hits and all(box for _, box in hits):
+            coarse = cv2.resize(img_array, (width // scale, height // scale), interpolation=cv2.INTER_AREA)
+            erase = [box for _, box in hits]
+            for _ in range(max_passes - 1):
+                for left, top, right, bottom in erase:
+                    cv2.rectangle(coarse, (left // scale, top // scale),
+                                  (right // scale, bottom // scale), 255, -1)
+                
+                coarse_hits = _read_zxing(coarse)
+                if not coarse_hits or not all(box for _, box in coarse_hits):
+                    break
+                
+                erase = []
+                for text, box in coarse_hits:
+                    # Decode the flagged region at full resolution, with a quiet zone
+                    left, top, right, bottom = (v * scale for v in box)
+                    pad = max(right - left, bottom - top) // 10
+                    x1, y1 = max(left - pad, 0), max(top - pad, 0)
+                    x2, y2 = min(right + pad, width), min(bottom + pad, height)
+                    region_hits = _read_zxing(img_array[y1:y2, x1:x2], x1, y1)
+                    if not all(hit_box for _, hit_box in region_hits):
+                        region_hits = []
+                    # The coarse read is already error-corrected; keep it if the region fails
+                    region_hits = region_hits or [(text, (left, top, right, bottom))]
+                    add_hits(region_hits)
+                    erase.append((left, top, right, bottom))
+        
+        return decoded_items if decoded_items else None
         
-    except ImportError:
-        return None
     except Exception as e:
         print(f"zxing-cpp error: {e}")
         return None
 
-def decode_with_pyzbar(image_path):
-    """Decode QR code using pyzbar library."""
+def decode_with_pyzbar(img_array):
+    """Decode QR codes from a grayscale array using pyzbar.
+    
+    Returns a list of hits with their bounding box, or None.
+    """
+    if not _HAS_PYZBAR:
+        return None
+    
     try:
-        from pyzbar import pyzbar
-        
-        # Read image
-        image = Image.open(image_path)
-        
-        # Convert to grayscale if needed
-        if image.mode != 'L':
-            gray_image = image.convert('L')
-        else:
-            gray_image = image
-        
         # Try to decode
-        qr_codes = pyzbar.decode(gray_image)
+        qr_codes = pyzbar.decode(img_array)
         
         if qr_codes:
             decoded_items = []
@@ -120,35 +291,107 @@ def decode_with_pyzbar(image_path):
                 # pyzbar returns rect
                 rect = qr_code.rect
                 box = (rect.left, rect.top, rect.left + rect.width, rect.top + rect.height)
-                crop_b64 = context_crop(image, box)
                 
                 decoded_items.append({
                     'text': qr_code.data.decode('utf-8'),
-                    'crop': crop_b64,
+                    'box': box,
                     'confidence': 'High (PyZbar)'
                 })
             return decoded_items
         
         return None
         
-    except ImportError:
-        return None
     except Exception as e:
         print(f"pyzbar error: {e}")
         return None
 
-def decode_qr_code(image_path):
-    """Decode QR code from image file using multiple detection methods."""
+def decode_with_qrdet(img_array):
+    """Locate QR codes with QRDet on the GPU, then decode each region with zxing-cpp.
+    
+    Returns a list of hits with their bounding box, or None.
+    """
+    if _QRDET is None or not _HAS_ZXING:
+        return None
+    
     try:
-        # First try zxing-cpp (best for QR codes with logos)
-        zxing_result = decode_with_zxing(image_path)
-        if zxing_result:
-            return zxing_result, None
+        # QRDet expects a 3-channel image; the decoders work on grayscale
+        bgr = cv2.cvtColor(img_array, cv2.COLOR_GRAY2BGR)
+        with _QRDET_LOCK:
+            detections = _QRDET.detect(image=bgr, is_bgr=True)
+        
+        height, width = img_array.shape[:2]
+        decoded_items = []
+        for detection in detections:
+            x1, y1, x2, y2 = (int(v) for v in detection['bbox_xyxy'])
+            
+            # Pad the box so zxing-cpp sees a quiet zone around the code
+            pad = max(x2 - x1, y2 - y1) // 10
+            x1, y1 = max(x1 - pad, 0), max(y1 - pad, 0)
+            x2, y2 = min(x2 + pad, width), min(y2 + pad, height)
+            
+            for item in decode_with_zxing(img_array[y1:y2, x1:x2], max_passes=1) or []:
+                # Shift the box from region to image coordinates
+                if item['box']:
+                    left, top, right, bottom = item['box']
+                    item['box'] = (left + x1, top + y1, right + x1, bottom + y1)
+                item['confidence'] = 'High (QRDet + ZXing)'
+                decoded_items.append(item)
+        return decoded_items if decoded_items else None
         
-        # Fallback to pyzbar
-        pyzbar_result = decode_with_pyzbar(image_path)
-        if pyzbar_result:
-            return pyzbar_result, None
+    except Exception as e:
+        print(f"qrdet error: {e}")
+        return None
+
+def decode_concurrently(img_array):
+    """Run zxing-cpp and pyzbar side by side and return the preferred hit.
+    
+    Both decoders start at once, but results are read in priority order:
+    zxing-cpp (best for QR codes with logos) first, then pyzbar.
+    """
+    futures = [
+        _DECODE_POOL.submit(decode_with_zxing, img_array),
+        _DECODE_POOL.submit(decode_with_pyzbar, img_array),
+    ]
+    for future in futures:
+        decoded_items = future.result()
+        if decoded_items:
+            # Drop pyzbar if it hasn't started yet; a running decode can't be stopped
+            for pending in futures:
+                pending.cancel()
+            return decoded_items
+    return None
+
+def add_crops(decoded_items, image_array, shrink=1):
+    """Replace each hit's bounding box with a base64 crop of the original image."""
+    for item in decoded_items:
+        box = item.pop('box')
+        if box:
+            # Boxes are in the coordinates of the (possibly shrunk) decoded array
+            box = tuple(v * shrink for v in box)
+            item['crop'] = context_crop(image_array, box)
+        else:
+            item['crop'] = None
+    return decoded_items
+
+def decode_qr_code(image_data):
+    """Decode QR code from encoded image bytes using multiple detection methods."""
+    try:
+        # Decode the pixels once and share them between both decoders
+        img_array, shrink = load_downscaled(image_data)
+        
+        # On GPU hosts let the detector find the codes first
+        decoded_items = decode_with_qrdet(img_array)
+        if not decoded_items:
+            decoded_items = decode_concurrently(img_array)
+        
+        # Small codes may not survive the shrink; retry at full resolution
+        if not decoded_items and shrink > 1:
+            img_array, shrink = load_grayscale(image_data), 1
+            decoded_items = decode_concurrently(img_array)
+        
+        if decoded_items:
+            # Only decode the color image when there is something to crop
+            return add_crops(decoded_items, load_color(image_data), shrink), None
         
         return None, "No QR code found in the image. Try using a clearer image with better contrast."
         
@@ -163,87 +406,13 @@ def decode_qr_from_base64(base64_string):
             base64_string = base64_string.split(',')[1]
         
         # Decode base64 to bytes
-        image_data = base64.b64decode(base64_string)
-        
-        # Convert to PIL Image
-        image = Image.open(io.BytesIO(image_data))
-        
-        # Save temp file to reuse existing valid logic or refactor
-        # Ideally we should refactor decode functions to take image object, but file path is required to match current signatures
-        # For memory efficiency, let's adapt the inner logic instead of saving files
-        
-        # First try zxing-cpp
-        try:
-            import zxingcpp
-            
-            if image.mode != 'L':
-                image_gray = image.convert('L')
-            else:
-                image_gray = image
-            
-            img_array = np.array(image_gray)
-            results = zxingcpp.read_barcodes(img_array)
-            
-            if results:
-                decoded_items = []
-                for result in results:
-                    if result.format == zxingcpp.BarcodeFormat.QRCode:
-                        try:
-                            pts = [(p.x, p.y) for p in [result.position.top_left, result.position.top_right, result.position.bottom_right, result.position.bottom_left]]
-                            min_x = min(p[0] for p in pts)
-                            max_x = max(p[0] for p in pts)
-                            min_y = min(p[1] for p in pts)
-                            max_y = max(p[1] for p in pts)
-                            box = (min_x, min_y, max_x, max_y)
-                            crop_b64 = context_crop(image, box)
-                        except:
-                            crop_b64 = None
-                            
-                        decoded_items.append({
-                            'text': result.text,
-                            'crop': crop_b64,
-                            'confidence': 'High (ZXing)'
-                        })
-                if decoded_items:
-                    return decoded_items, None
-        except ImportError:
-            pass
-        except Exception as e:
-            print(f"zxing-cpp error: {e}")
-        
-        # Fallback to pyzbar
-        try:
-            from pyzbar import pyzbar
-            
-            if image.mode != 'L':
-                image_gray = image.convert('L')
-            else:
-                image_gray = image
-            
-            qr_codes = pyzbar.decode(image_gray)
-            
-            if qr_codes:
-                decoded_items = []
-                for qr_code in qr_codes:
-                    rect = qr_code.rect
-                    box = (rect.left, rect.top, rect.left + rect.width, rect.top + rect.height)
-                    crop_b64 = context_crop(image, box)
-                    
-                    decoded_items.append({
-                        'text': qr_code.data.decode('utf-8'),
-                        'crop': crop_b64,
-                        'confidence': 'High (PyZbar)'
-                    })
-                return decoded_items, None
-        except ImportError:
-            pass
-        except Exception as e:
-            print(f"pyzbar error: {e}")
-        
-        return None, "No QR code found in the image. Try using a clearer image with better contrast."
+        image_data = b64decode(base64_string)
         
     except Exception as e:
         return None, f"Error processing image: {str(e)}"
+    
+    # Share the same decoding path as file uploads
+    return decode_qr_code(image_data)
 
 @app.route('/')
 def index():
@@ -253,18 +422,21 @@ def index():
 @app.route('/robots.txt')
 def robots():
     """Serve robots.txt."""
-    return send_from_directory(app.static_folder if app.static_folder else '.', 'robots.txt')
+    return send_from_directory(app.static_folder if app.static_folder else '.', 'robots.txt',
+                               max_age=STATIC_MAX_AGE)
 
 @app.route('/sitemap.xml')
 def sitemap():
     """Serve sitemap.xml."""
-    return send_from_directory(app.static_folder if app.static_folder else '.', 'sitemap.xml')
+    return send_from_directory(app.static_folder if app.static_folder else '.', 'sitemap.xml',
+                               max_age=STATIC_MAX_AGE)
 
 @app.route('/favicon.ico')
 def favicon():
     """Serve favicon.ico."""
     return send_from_directory(app.static_folder if app.static_folder else 'static',
-                             'favicon.png', mimetype='image/vnd.microsoft.icon')
+                             'favicon.png', mimetype='image/vnd.microsoft.icon',
+                             max_age=STATIC_MAX_AGE)
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
@@ -275,20 +447,16 @@ def upload_file():
     
     file = request.files['file']
     
-    if file.filename == '':
+    if not file.filename:
         flash('No file selected')
         return redirect(url_for('index'))
     
-    if file and allowed_file(file.filename):
+    # Check the magic bytes too, so non-images are rejected before decoding
+    if file and allowed_file(file.filename) and has_image_signature(file.stream):
         filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Decode QR code
-        decoded_data, error = decode_qr_code(filepath)
         
-        # Clean up uploaded file
-        os.remove(filepath)
+        # Decode QR code straight from the upload, without touching disk
+        decoded_data, error = decode_qr_code(file.read())
         
         if error:
             flash(f'Error: {error}')
@@ -304,22 +472,19 @@ def upload_file():
 @app.route('/decode_base64', methods=['POST'])
 def decode_base64():
     """Handle base64 image decoding via API."""
-    try:
-        data = request.get_json()
-        base64_image = data.get('image')
-        
-        if not base64_image:
-            return jsonify({'error': 'No image data provided'}), 400
-        
-        decoded_data, error = decode_qr_from_base64(base64_image)
-        
-        if error:
-            return jsonify({'error': error}), 400
-        
-        return jsonify({'decoded_data': decoded_data})
-        
-    except Exception as e:
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
+    # silent=True: a missing or malformed body is a client error, not a 500
+    data = request.get_json(silent=True)
+    base64_image = data.get('image') if isinstance(data, dict) else None
+    
+    if not base64_image:
+        return jsonify({'error': 'No image data provided'}), 400
+    
+    decoded_data, error = decode_qr_from_base64(base64_image)
+    
+    if error:
+        return jsonify({'error': error}), 400
+    
+    return jsonify({'decoded_data': decoded_data})
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
@@ -6,10 +6,27 @@ Usage: python cli_qr_reader.py <image_path>
 
 import sys
 import os
+import mmap
 from PIL import Image
 import cv2
 import numpy as np
 
+# Reuse one detector instead of constructing it for every image
+_QR_DETECTOR = cv2.QRCodeDetector()
+
+def read_grayscale(image_path):
+    """Read an image file as grayscale through a read-only memory map."""
+    with open(image_path, 'rb') as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            gray = cv2.imdecode(buf, cv2.IMREAD_GRAYSCALE)
+            # Drop the view before the map is closed
+            del buf
+    return gray
+
 def decode_qr_code(image_path):
     """Decode QR code from image file using OpenCV with improved detection."""
     try:
@@ -18,29 +35,19 @@ def decode_qr_code(image_path):
             print(f"Error: File '{image_path}' not found.")
             return False
         
-        # Read the image
-        image = cv2.imread(image_path)
+        # Read the image straight as grayscale; the detector converts
+        # color input to gray internally anyway
+        gray = read_grayscale(image_path)
         
-        if image is None:
+        if gray is None:
             print(f"Error: Could not read the image file '{image_path}'.")
             print("Supported formats: PNG, JPG, JPEG, GIF, BMP, TIFF")
             return False
         
         # Try multiple approaches for better detection
-        qr_detector = cv2.QRCodeDetector()
+        qr_detector = _QR_DETECTOR
         
         # First attempt: direct detection
-        data, bbox, _ = qr_detector.detectAndDecode(image)
-        
-        if data:
-            print(f"Found QR code in '{image_path}':")
-            print("-" * 50)
-            print(f"Content: {data}")
-            detect_content_type(data)
-            return True
-        
-        # Second attempt: convert to grayscale and try again
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         data, bbox, _ = qr_detector.detectAndDecode(gray)
         
         if data:
@@ -50,7 +57,7 @@ def decode_qr_code(image_path):
             detect_content_type(data)
             return True
         
-        # Third attempt: apply some preprocessing
+        # Second attempt: apply some preprocessing
         # Resize image if it's too small
         height, width = gray.shape
         if height < 200 or width < 200:
@@ -70,7 +77,7 @@ def decode_qr_code(image_path):
             detect_content_type(data)
             return True
         
-        # Fourth attempt: more aggressive preprocessing for difficult QR codes
+        # Third attempt: more aggressive preprocessing for difficult QR codes
         # Apply Gaussian blur to reduce noise
         blurred = cv2.GaussianBlur(gray, (3, 3), 0)
         
@@ -85,7 +92,7 @@ def decode_qr_code(image_path):
             detect_content_type(data)
             return True
         
-        # Fifth attempt: morphological operations
+        # Fourth attempt: morphological operations
         kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
         morph = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
         data, bbox, _ = qr_detector.detectAndDecode(morph)
@@ -9,23 +9,26 @@ import cv2
 import numpy as np
 from PIL import Image
 
+# Reuse one detector instead of constructing it for every image
+_QR_DETECTOR = cv2.QRCodeDetector()
+
 def try_opencv_detection(image_path):
     """Try OpenCV QR detection with multiple preprocessing methods."""
     try:
-        image = cv2.imread(image_path)
-        if image is None:
+        # Read straight as grayscale; the detector converts color input to
+        # gray internally, so a separate color attempt adds nothing
+        gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             return None
         
-        qr_detector = cv2.QRCodeDetector()
+        qr_detector = _QR_DETECTOR
         
         # Try different preprocessing approaches
         approaches = [
-            ("Original", image),
-            ("Grayscale", cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)),
+            ("Grayscale", gray),
         ]
         
         # Add resizing if image is small
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         height, width = gray.shape
         if height < 200 or width < 200:
             scale_factor = max(200/height, 200/width)
@@ -61,6 +64,9 @@ def try_pyzbar_detection(image_path):
         # Read image with PIL
         image = Image.open(image_path)
         
+        # For JPEGs, have libjpeg decode only the luma plane (no-op otherwise)
+        image.draft('L', image.size)
+        
         # Convert to grayscale if needed
         if image.mode != 'L':
             image = image.convert('L')
@@ -43,6 +43,13 @@ def test_imports():
         print("❌ NumPy not found. Run: pip install numpy")
         return False
     
+    try:
+        import cv2
+        print("✅ OpenCV imported successfully")
+    except ImportError:
+        print("❌ OpenCV not found. Run: pip install opencv-python-headless")
+        return False
+    
     return True
 
 def test_file_structure():
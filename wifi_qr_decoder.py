@@ -8,17 +8,12 @@ import numpy as np
 from PIL import Image
 import os
 
-def preprocess_for_logo_qr(image_path):
-    """Preprocess image specifically for QR codes with logos in center."""
+# Reuse one detector instead of constructing it for every image
+_QR_DETECTOR = cv2.QRCodeDetector()
+
+def preprocess_for_logo_qr(gray):
+    """Preprocess a grayscale image specifically for QR codes with logos in center."""
     try:
-        # Read image
-        image = cv2.imread(image_path)
-        if image is None:
-            return None
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
         # Get image dimensions
         height, width = gray.shape
         
@@ -54,31 +49,27 @@ def preprocess_for_logo_qr(image_path):
 def try_multiple_detection_methods(image_path):
     """Try multiple detection methods for difficult QR codes."""
     try:
-        image = cv2.imread(image_path)
-        if image is None:
+        # Read once, straight as grayscale; the detector converts color
+        # input to gray internally, so a separate color attempt adds nothing
+        gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             return None
         
-        qr_detector = cv2.QRCodeDetector()
-        
-        # Method 1: Original image
-        data, bbox, _ = qr_detector.detectAndDecode(image)
-        if data:
-            return data
+        qr_detector = _QR_DETECTOR
         
-        # Method 2: Grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Method 1: Grayscale
         data, bbox, _ = qr_detector.detectAndDecode(gray)
         if data:
             return data
         
-        # Method 3: Preprocessed for logo
-        processed = preprocess_for_logo_qr(image_path)
+        # Method 2: Preprocessed for logo
+        processed = preprocess_for_logo_qr(gray)
         if processed is not None:
             data, bbox, _ = qr_detector.detectAndDecode(processed)
             if data:
                 return data
         
-        # Method 4: Different thresholding approaches
+        # Method 3: Different thresholding approaches
         thresholds = [
             cv2.THRESH_BINARY,
             cv2.THRESH_BINARY_INV,
@@ -93,7 +84,7 @@ def try_multiple_detection_methods(image_path):
             if data:
                 return data
         
-        # Method 5: Adaptive thresholding with different parameters
+        # Method 4: Adaptive thresholding with different parameters
         for block_size in [11, 15, 19]:
             for c in [2, 5, 10]:
                 adaptive_thresh = cv2.adaptiveThreshold(
@@ -103,14 +94,14 @@ def try_multiple_detection_methods(image_path):
                 if data:
                     return data
         
-        # Method 6: Morphological operations
+        # Method 5: Morphological operations
         kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
         morph = cv2.morphologyEx(gray, cv2.MORPH_CLOSE, kernel)
         data, bbox, _ = qr_detector.detectAndDecode(morph)
         if data:
             return data
         
-        # Method 7: Edge detection
+        # Method 6: Edge detection
         edges = cv2.Canny(gray, 50, 150)
         data, bbox, _ = qr_detector.detectAndDecode(edges)
         if data:
@@ -7,21 +7,18 @@ import sys
 import os
 from PIL import Image
 import numpy as np
+import cv2
 
 def decode_with_zxing(image_path):
     """Decode QR code using zxing-cpp."""
     try:
         import zxingcpp
         
-        # Read image
-        image = Image.open(image_path)
-        
-        # Convert to grayscale if needed
-        if image.mode != 'L':
-            image = image.convert('L')
-        
-        # Convert PIL image to numpy array
-        img_array = np.array(image)
+        # Read image straight into a grayscale array
+        img_array = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if img_array is None:
+            # Formats OpenCV can't read (e.g. GIF) go through PIL instead
+            img_array = np.asarray(Image.open(image_path).convert('L'))
         
         # Try to decode
         results = zxingcpp.read_barcodes(img_array)